@@ -1,5 +1,7 @@
 """Blizzard HTTP client adapter implementing BlizzardClientPort"""
 
+import asyncio
+
 import httpx
 from fastapi import HTTPException, status
 
@@ -20,6 +22,9 @@ class BlizzardClient(metaclass=Singleton):
 
     def __init__(self):
         self.cache_manager = CacheManager()
+        # In-flight requests mapping, used to coalesce concurrent calls
+        # on the same Blizzard page into a single HTTP request
+        self.inflight_requests: dict[tuple, asyncio.Task] = {}
         self.client = httpx.AsyncClient(
             headers={
                 "User-Agent": (
@@ -40,7 +45,39 @@ class BlizzardClient(metaclass=Singleton):
         headers: dict[str, str] | None = None,
         params: dict[str, str] | None = None,
     ) -> httpx.Response:
-        """Make an HTTP GET request with custom headers and retrieve the result"""
+        """Make an HTTP GET request with custom headers and retrieve the result.
+
+        Concurrent calls on the same URL and params are coalesced : only one
+        HTTP request is made to Blizzard, and every caller awaits the same
+        result. Headers aren't part of the key as they're always identical
+        for a given Blizzard page.
+        """
+        request_key = (url, tuple(sorted(params.items())) if params else None)
+
+        # If the same request is already in-flight, wait for its result
+        # instead of making another call to Blizzard. Awaits are shielded
+        # so a caller being cancelled (client disconnect) doesn't cancel
+        # the shared task under its siblings
+        if (inflight_request := self.inflight_requests.get(request_key)) is not None:
+            return await asyncio.shield(inflight_request)
+
+        request_task = asyncio.ensure_future(
+            self._request(url, headers=headers, params=params)
+        )
+        self.inflight_requests[request_key] = request_task
+        request_task.add_done_callback(
+            lambda _: self.inflight_requests.pop(request_key, None)
+        )
+        return await asyncio.shield(request_task)
+
+    async def _request(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        params: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Effectively make an HTTP GET request to Blizzard"""
 
         # First, check if we're being rate limited
         self._check_rate_limit()
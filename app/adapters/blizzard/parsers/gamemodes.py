@@ -1,5 +1,7 @@
 """Stateless parser functions for gamemodes data"""
 
+from functools import cache
+
 from app.adapters.csv import CSVReader
 from app.config import settings
 
@@ -9,9 +11,11 @@ def get_static_url_gamemodes(key: str, extension: str) -> str:
     return f"{settings.app_base_url}/static/gamemodes/{key}.{extension}"
 
 
+@cache
 def parse_gamemodes_csv() -> list[dict]:
     """
-    Parse gamemodes list from CSV file
+    Parse gamemodes list from CSV file. The CSV is static application
+    data, so the resulting list is only built once.
 
     Returns:
         List of gamemode dicts with keys: key, name, icon, description, screenshot
@@ -24,6 +24,26 @@ from app.heroes.enums import MediaType
 from app.overfast_logger import logger
 from app.roles.helpers import get_role_from_icon_url
 
+# Pattern matching the birthday line, compiled once at import
+BIRTHDAY_PATTERN = re.compile(r"^(.*) [\(（].*[:：] ?(\d+).*[\)）]$")
+
+# Text for "Unknown" birthday in different locales
+UNKNOWN_BIRTHDAY_TEXTS = {
+    Locale.GERMAN: "Unbekannt",
+    Locale.ENGLISH_EU: "Unknown",
+    Locale.ENGLISH_US: "Unknown",
+    Locale.SPANISH_EU: "Desconocido",
+    Locale.SPANISH_LATIN: "Desconocido",
+    Locale.FRENCH: "Inconnu",
+    Locale.ITALIANO: "Sconosciuto",
+    Locale.JAPANESE: "不明",
+    Locale.KOREAN: "알 수 없음",
+    Locale.POLISH: "Nieznane",
+    Locale.PORTUGUESE_BRAZIL: "Desconhecido",
+    Locale.RUSSIAN: "Неизвестно",
+    Locale.CHINESE_TAIWAN: "未知",
+}
+
 
 async def fetch_hero_html(
     client: BlizzardClient,
@@ -111,29 +131,11 @@ def _parse_hero_summary(overview_section: LexborNode, locale: Locale) -> dict:
 
 def _parse_birthday_and_age(text: str, locale: Locale) -> tuple[str | None, int | None]:
     """Extract birthday and age from text for a given locale"""
-    birthday_regex = r"^(.*) [\(（].*[:：] ?(\d+).*[\)）]$"
-
-    result = re.match(birthday_regex, text)
+    result = BIRTHDAY_PATTERN.match(text)
     if not result:
         return None, None
 
-    # Text for "Unknown" in different locales
-    unknown_texts = {
-        Locale.GERMAN: "Unbekannt",
-        Locale.ENGLISH_EU: "Unknown",
-        Locale.ENGLISH_US: "Unknown",
-        Locale.SPANISH_EU: "Desconocido",
-        Locale.SPANISH_LATIN: "Desconocido",
-        Locale.FRENCH: "Inconnu",
-        Locale.ITALIANO: "Sconosciuto",
-        Locale.JAPANESE: "不明",
-        Locale.KOREAN: "알 수 없음",
-        Locale.POLISH: "Nieznane",
-        Locale.PORTUGUESE_BRAZIL: "Desconhecido",
-        Locale.RUSSIAN: "Неизвестно",
-        Locale.CHINESE_TAIWAN: "未知",
-    }
-    unknown_text = unknown_texts.get(locale, "Unknown")
+    unknown_text = UNKNOWN_BIRTHDAY_TEXTS.get(locale, "Unknown")
 
     birthday = result[1] if result[1] != unknown_text else None
     age = int(result[2]) if result[2] else None
@@ -84,14 +84,16 @@ def parse_heroes_html(html: str) -> list[dict]:
 def filter_heroes(
     heroes: list[dict], role: str | None, gamemode: HeroGamemode | None
 ) -> list[dict]:
-    """Filter heroes list by role and gamemode"""
-    if role:
-        heroes = [hero for hero in heroes if hero["role"] == role]
-
-    if gamemode:
-        heroes = [hero for hero in heroes if gamemode in hero["gamemodes"]]
-
-    return heroes
+    """Filter heroes list by role and gamemode in a single pass"""
+    if not role and not gamemode:
+        return heroes
+
+    return [
+        hero
+        for hero in heroes
+        if (not role or hero["role"] == role)
+        and (not gamemode or gamemode in hero["gamemodes"])
+    ]
 
 
 async def parse_heroes(
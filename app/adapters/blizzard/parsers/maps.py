@@ -1,5 +1,7 @@
 """Stateless parser functions for maps data"""
 
+from functools import cache
+
 from app.adapters.csv import CSVReader
 from app.config import settings
 
@@ -9,9 +11,11 @@ def get_static_url_maps(key: str, extension: str = "jpg") -> str:
     return f"{settings.app_base_url}/static/maps/{key}.{extension}"
 
 
+@cache
 def parse_maps_csv() -> list[dict]:
     """
-    Parse maps list from CSV file
+    Parse maps list from CSV file. The CSV is static application
+    data, so the resulting list is only built once.
 
     Returns:
         List of map dicts with keys: key, name, screenshot, gamemodes, location, country_code
@@ -113,7 +113,12 @@ def parse_player_career_stats_from_html(
     Returns:
         Career stats dict, filtered by query parameters
     """
-    profile_data = parse_player_profile_html(html, player_summary)
+    # Only the stats sections are needed here, skip summary parsing
+    profile_data = parse_player_profile_html(
+        html,
+        player_summary,
+        include_summary=False,
+    )
     return _process_career_stats(profile_data, platform, gamemode, hero)
 
 
@@ -81,6 +81,9 @@ async def fetch_player_html(client: BlizzardClient, player_id: str) -> str:
 def parse_player_profile_html(
     html: str,
     player_summary: dict | None = None,
+    *,
+    include_summary: bool = True,
+    include_stats: bool = True,
 ) -> dict:
     """
     Parse player profile HTML into summary and stats
@@ -89,9 +92,12 @@ def parse_player_profile_html(
         html: Raw HTML from player profile page
         player_summary: Optional player summary data from search endpoint
             (provides avatar, namecard, title, lastUpdated)
+        include_summary: Whether to parse the summary section
+        include_stats: Whether to parse the stats sections
 
     Returns:
-        Dict with "summary" and "stats" keys
+        Dict with "summary" and "stats" keys, limited to the
+        requested sections
 
     Raises:
         ParserBlizzardError: If player not found (profile section missing)
@@ -105,10 +111,15 @@ def parse_player_profile_html(
             message="Player not found",
         )
 
-    return {
-        "summary": _parse_summary(root_tag, player_summary),
-        "stats": _parse_stats(root_tag),
-    }
+    # Only parse the requested sections, stats parsing in particular
+    # walks the whole career statistics DOM
+    profile_data = {}
+    if include_summary:
+        profile_data["summary"] = _parse_summary(root_tag, player_summary)
+    if include_stats:
+        profile_data["stats"] = _parse_stats(root_tag)
+
+    return profile_data
 
 
 def _parse_summary(root_tag: LexborNode, player_summary: dict | None) -> dict:
@@ -379,7 +379,12 @@ def parse_player_stats_summary_from_html(
     Returns:
         Dict with "general", "roles", and "heroes" stats
     """
-    profile_data = parse_player_profile_html(html, player_summary)
+    # Only the stats sections are needed here, skip summary parsing
+    profile_data = parse_player_profile_html(
+        html,
+        player_summary,
+        include_summary=False,
+    )
     return _process_player_stats_summary(profile_data, gamemode, platform)
 
 
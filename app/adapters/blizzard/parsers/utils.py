@@ -26,6 +26,11 @@ def validate_response_status(
     Raises:
         HTTPException: If status code is not valid
     """
+    # Fast path : with the default codes, HTTP 200 is valid, skip the
+    # list handling entirely for the nominal case
+    if valid_codes is None and response.status_code == status.HTTP_200_OK:
+        return
+
     if valid_codes is None:
         valid_codes = [200]
 
@@ -33,6 +33,12 @@ from app.overfast_logger import logger
 if TYPE_CHECKING:
     from fastapi import Request
 
+# Cache key prefixes, computed once at import time so the hot cache
+# accessors don't have to go through settings attribute access and
+# string formatting on every call
+API_CACHE_KEY_PREFIX = f"{settings.api_cache_key_prefix}:"
+PLAYER_CACHE_KEY_PREFIX = f"{settings.player_cache_key_prefix}:"
+
 
 class ValkeyCache(metaclass=Singleton):
     """
@@ -117,57 +123,58 @@ class ValkeyCache(metaclass=Singleton):
         return result or False
 
     # Legacy application-specific methods (kept for backward compatibility during migration)
+    # These run on every request, so they use direct try/except instead
+    # of allocating a closure for _handle_valkey_error on each call
     def get_api_cache(self, cache_key: str) -> dict | list | None:
         """Get the API Cache value associated with a given cache key"""
+        try:
+            api_cache = self.valkey_server.get(API_CACHE_KEY_PREFIX + cache_key)
+        except valkey.exceptions.ValkeyError as err:
+            self.log_warning(err)
+            return None
 
-        def _get_api_cache():
-            api_cache_key = f"{settings.api_cache_key_prefix}:{cache_key}"
-            api_cache = self.valkey_server.get(api_cache_key)
-            if not api_cache or not isinstance(api_cache, bytes):
-                return None
-            return self._decompress_json_value(api_cache)
-
-        return self._handle_valkey_error(_get_api_cache)
+        if not api_cache or not isinstance(api_cache, bytes):
+            return None
+        return self._decompress_json_value(api_cache)
 
     def update_api_cache(self, cache_key: str, value: dict | list, expire: int) -> None:
         """Update or set an API Cache value with an expiration value (in seconds)"""
-
-        def _update_api_cache():
-            bytes_value = self._compress_json_value(value)
+        bytes_value = self._compress_json_value(value)
+        try:
             self.valkey_server.set(
-                f"{settings.api_cache_key_prefix}:{cache_key}",
+                API_CACHE_KEY_PREFIX + cache_key,
                 bytes_value,
                 ex=expire,
             )
-
-        self._handle_valkey_error(_update_api_cache)
+        except valkey.exceptions.ValkeyError as err:
+            self.log_warning(err)
 
     def get_player_cache(self, player_id: str) -> dict | list | None:
         """Get the Player Cache value associated with a given cache key"""
-
-        def _get_player_cache():
-            player_key = f"{settings.player_cache_key_prefix}:{player_id}"
+        player_key = PLAYER_CACHE_KEY_PREFIX + player_id
+        try:
             player_cache = self.valkey_server.get(player_key)
             if not player_cache or not isinstance(player_cache, bytes):
                 return None
             # Reset the TTL before returning the value
             self.valkey_server.expire(player_key, settings.player_cache_timeout)
-            return self._decompress_json_value(player_cache)
+        except valkey.exceptions.ValkeyError as err:
+            self.log_warning(err)
+            return None
 
-        return self._handle_valkey_error(_get_player_cache)
+        return self._decompress_json_value(player_cache)
 
     def update_player_cache(self, player_id: str, value: dict) -> None:
         """Update or set a Player Cache value"""
-
-        def _update_player_cache():
-            compressed_value = self._compress_json_value(value)
+        compressed_value = self._compress_json_value(value)
+        try:
             self.valkey_server.set(
-                f"{settings.player_cache_key_prefix}:{player_id}",
+                PLAYER_CACHE_KEY_PREFIX + player_id,
                 value=compressed_value,
                 ex=settings.player_cache_timeout,
             )
-
-        self._handle_valkey_error(_update_player_cache)
+        except valkey.exceptions.ValkeyError as err:
+            self.log_warning(err)
 
     def is_being_rate_limited(self) -> bool:
         def _is_rate_limited():
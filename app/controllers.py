@@ -1,6 +1,7 @@
 """Abstract API Controller module"""
 
 from abc import ABC, abstractmethod
+from functools import cache
 
 from fastapi import HTTPException, Request, Response
 
@@ -10,6 +11,18 @@ from .exceptions import ParserBlizzardError, ParserParsingError
 from .helpers import get_human_readable_duration, overfast_internal_error
 from .overfast_logger import logger
 
+# Header name bound once at import time : settings attribute access goes
+# through pydantic-settings machinery and runs on every request otherwise
+CACHE_TTL_HEADER = settings.cache_ttl_header
+
+
+@cache
+def get_cache_ttl_header_value(timeout: int) -> str:
+    """Header value for a given Cache TTL. Timeouts are class-level
+    constants, so the string is only ever computed once per distinct value
+    """
+    return str(timeout)
+
 
 class AbstractController(ABC):
     """Generic Abstract API Controller, containing attributes structure and methods
@@ -18,6 +31,10 @@ class AbstractController(ABC):
     The API Cache system is handled here.
     """
 
+    # Controllers are instanciated on every request : slots avoid
+    # allocating a per-instance __dict__ for two known attributes
+    __slots__ = ("cache_key", "response")
+
     # Generic cache manager class, used to manipulate Valkey cache data
     cache_manager = CacheManager()
 
@@ -41,6 +58,29 @@ class AbstractController(ABC):
     def get_human_readable_timeout(cls) -> str:
         return get_human_readable_duration(cls.timeout)
 
+    def set_cache_ttl_header(self) -> None:
+        """Ensure response headers contains Cache TTL. Starlette headers
+        mutation walks the raw headers list, skip it when the right value
+        is already set
+        """
+        header_value = get_cache_ttl_header_value(self.timeout)
+        if self.response.headers.get(CACHE_TTL_HEADER) != header_value:
+            self.response.headers[CACHE_TTL_HEADER] = header_value
+
+    def get_api_cache_data(self) -> dict | list | None:
+        """Retrieve the API Cache value associated with the request, if any.
+        In production, nginx serves the API Cache before the application is
+        even called ; this method covers deployments without the reverse
+        proxy and skips Blizzard calls and parsing for hot requests. When a
+        value is found, the Cache TTL header is set like for a computed
+        response.
+        """
+        api_cache_data = self.cache_manager.get_api_cache(self.cache_key)
+        if api_cache_data is not None:
+            logger.info("API Cache found, returning it...")
+            self.set_cache_ttl_header()
+        return api_cache_data
+
     async def process_request(self, **kwargs) -> dict | list:
         """Main method used to process the request from user and return final data. Raises
         an HTTPException in case of error when retrieving or parsing data.
@@ -78,7 +118,7 @@ class AbstractController(ABC):
         self.cache_manager.update_api_cache(self.cache_key, computed_data, self.timeout)
 
         # Ensure response headers contains Cache TTL
-        self.response.headers[settings.cache_ttl_header] = str(self.timeout)
+        self.set_cache_ttl_header()
 
         logger.info("Done ! Returning filtered data...")
         return computed_data
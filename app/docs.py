@@ -1,4 +1,5 @@
 import json
+from functools import cache
 
 from fastapi.responses import HTMLResponse
 
@@ -59,6 +60,25 @@ def render_documentation(
     openapi_url: str,
 ) -> HTMLResponse:
     """Render the Overwatch-themed Redoc page."""
+    return HTMLResponse(
+        content=_render_documentation_html(
+            title=title,
+            favicon_url=favicon_url,
+            openapi_url=openapi_url,
+        ),
+    )
+
+
+@cache
+def _render_documentation_html(
+    *,
+    title: str,
+    favicon_url: str,
+    openapi_url: str,
+) -> str:
+    """Build the Redoc page HTML. The page only depends on static
+    settings, so it's rendered once and cached.
+    """
 
     redoc_options = {"theme": OVERFAST_REDOC_THEME, "hideLoading": True}
     options_json = json.dumps(redoc_options)
@@ -95,4 +115,4 @@ def render_documentation(
     </html>
     """
 
-    return HTMLResponse(content=html_content)
+    return html_content
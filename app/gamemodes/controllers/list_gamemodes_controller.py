@@ -12,6 +12,8 @@ class ListGamemodesController(AbstractController):
     available Overwatch gamemodes.
     """
 
+    __slots__ = ()
+
     parser_classes: ClassVar[list[type]] = []
     timeout = settings.csv_cache_timeout
 
@@ -21,6 +23,6 @@ class ListGamemodesController(AbstractController):
 
         # Update API Cache
         self.cache_manager.update_api_cache(self.cache_key, data, self.timeout)
-        self.response.headers[settings.cache_ttl_header] = str(self.timeout)
+        self.set_cache_ttl_header()
 
         return data
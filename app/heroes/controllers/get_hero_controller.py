@@ -1,5 +1,6 @@
 """Hero Controller module"""
 
+import asyncio
 from typing import Any, ClassVar
 
 from fastapi import HTTPException
@@ -20,20 +21,39 @@ class GetHeroController(AbstractController):
     Overwatch hero.
     """
 
+    __slots__ = ()
+
     parser_classes: ClassVar[list[type]] = []
     timeout = settings.hero_path_cache_timeout
 
     async def process_request(self, **kwargs) -> dict:
         """Process request using stateless parser functions"""
+        # Serve from API Cache whenever possible
+        if (api_cache_data := self.get_api_cache_data()) is not None:
+            return api_cache_data
+
         hero_key = kwargs["hero_key"]
         locale = kwargs.get("locale") or Locale.ENGLISH_US
 
         client = BlizzardClient()
 
         try:
-            # Fetch data from all three sources
-            hero_data = await parse_hero(client, str(hero_key), locale)
-            heroes_list = await parse_heroes(client, locale)
+            # Fetch data from all three sources. Hero page and heroes list
+            # are two distinct Blizzard pages, retrieve them concurrently.
+            # HeroKey is a StrEnum, so the key can be passed around as
+            # a string directly. Wait until both fetches settled before
+            # raising any error, so a failure on the hero page (unknown
+            # hero) doesn't leave the heroes list fetch running detached
+            hero_result, heroes_result = await asyncio.gather(
+                parse_hero(client, hero_key, locale),
+                parse_heroes(client, locale),
+                return_exceptions=True,
+            )
+            if isinstance(hero_result, BaseException):
+                raise hero_result
+            if isinstance(heroes_result, BaseException):
+                raise heroes_result
+            hero_data, heroes_list = hero_result, heroes_result
             heroes_stats = parse_heroes_stats()
 
             # Merge data
@@ -52,7 +72,7 @@ class GetHeroController(AbstractController):
 
         # Update API Cache
         self.cache_manager.update_api_cache(self.cache_key, data, self.timeout)
-        self.response.headers[settings.cache_ttl_header] = str(self.timeout)
+        self.set_cache_ttl_header()
 
         return data
 
@@ -129,8 +149,10 @@ def dict_insert_value_before_key(
     if key not in data:
         raise KeyError
 
-    key_pos = list(data.keys()).index(key)
-    data_items = list(data.items())
-    data_items.insert(key_pos, (new_key, new_value))
+    new_data = {}
+    for current_key, current_value in data.items():
+        if current_key == key:
+            new_data[new_key] = new_value
+        new_data[current_key] = current_value
 
-    return dict(data_items)
+    return new_data
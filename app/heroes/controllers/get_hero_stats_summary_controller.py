@@ -16,11 +16,17 @@ class GetHeroStatsSummaryController(AbstractController):
     retrieve usage statistics for Overwatch heroes.
     """
 
+    __slots__ = ()
+
     parser_classes: ClassVar[list[type]] = []
     timeout = settings.hero_stats_cache_timeout
 
     async def process_request(self, **kwargs) -> list[dict]:
         """Process request using stateless parser function"""
+        # Serve from API Cache whenever possible
+        if (api_cache_data := self.get_api_cache_data()) is not None:
+            return api_cache_data
+
         client = BlizzardClient()
 
         try:
@@ -42,6 +48,6 @@ class GetHeroStatsSummaryController(AbstractController):
 
         # Update API Cache
         self.cache_manager.update_api_cache(self.cache_key, data, self.timeout)
-        self.response.headers[settings.cache_ttl_header] = str(self.timeout)
+        self.set_cache_ttl_header()
 
         return data
@@ -16,12 +16,18 @@ class ListHeroesController(AbstractController):
     retrieve a list of available Overwatch heroes.
     """
 
+    __slots__ = ()
+
     # Keep parser_classes for backward compatibility, but it's no longer used
     parser_classes: ClassVar[list[type]] = []
     timeout = settings.heroes_path_cache_timeout
 
     async def process_request(self, **kwargs) -> list[dict]:
         """Process request using stateless parser function"""
+        # Serve from API Cache whenever possible
+        if (api_cache_data := self.get_api_cache_data()) is not None:
+            return api_cache_data
+
         # Extract params
         role = kwargs.get("role")
         locale = kwargs.get("locale") or Locale.ENGLISH_US
@@ -43,6 +49,6 @@ class ListHeroesController(AbstractController):
         self.cache_manager.update_api_cache(self.cache_key, data, self.timeout)
 
         # Ensure response headers contains Cache TTL
-        self.response.headers[settings.cache_ttl_header] = str(self.timeout)
+        self.set_cache_ttl_header()
 
         return data
@@ -91,16 +91,20 @@ In player career statistics, various conversions are applied for ease of use:
 """
 
 
+# JSON encoder enforcing ASCII and compact separators, built once
+# instead of configuring json.dumps on every response
+ascii_json_encoder = json.JSONEncoder(
+    ensure_ascii=True,
+    allow_nan=False,
+    indent=None,
+    separators=(",", ":"),
+)
+
+
 # Custom JSONResponse class that enforces ASCII encoding
 class ASCIIJSONResponse(JSONResponse):
     def render(self, content: Any) -> bytes:
-        return json.dumps(
-            content,
-            ensure_ascii=True,
-            allow_nan=False,
-            indent=None,
-            separators=(",", ":"),
-        ).encode("utf-8")
+        return ascii_json_encoder.encode(content).encode("utf-8")
 
 
 app = FastAPI(
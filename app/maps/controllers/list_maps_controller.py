@@ -12,6 +12,8 @@ class ListMapsController(AbstractController):
     available Overwatch maps.
     """
 
+    __slots__ = ()
+
     parser_classes: ClassVar[list[type]] = []
     timeout = settings.csv_cache_timeout
 
@@ -22,6 +24,6 @@ class ListMapsController(AbstractController):
 
         # Update API Cache
         self.cache_manager.update_api_cache(self.cache_key, data, self.timeout)
-        self.response.headers[settings.cache_ttl_header] = str(self.timeout)
+        self.set_cache_ttl_header()
 
         return data
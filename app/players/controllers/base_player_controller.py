@@ -18,6 +18,8 @@ class BasePlayerController(AbstractController):
     to prevent spamming Blizzard with calls.
     """
 
+    __slots__ = ()
+
     def check_unknown_player(self, player_id: str) -> None:
         """
         Check if player is known to not exist and raise 404 if so.
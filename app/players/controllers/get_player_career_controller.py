@@ -28,6 +28,8 @@ class GetPlayerCareerController(BasePlayerController):
     Overwatch career : summary, statistics about heroes, etc.
     """
 
+    __slots__ = ()
+
     parser_classes: ClassVar[list] = []
     timeout = settings.career_path_cache_timeout
 
@@ -46,6 +48,10 @@ class GetPlayerCareerController(BasePlayerController):
             gamemode_filter = kwargs.get("gamemode")
             hero_filter = kwargs.get("hero")
 
+            # Only parse the profile sections the query needs
+            include_summary = not stats_filter
+            include_stats = not summary_filter
+
             try:
                 # Get player summary from search endpoint
                 player_summary = await parse_player_summary(client, player_id)
@@ -55,7 +61,12 @@ class GetPlayerCareerController(BasePlayerController):
                 if not player_summary:
                     logger.info("Player not found in search, fetching directly")
                     html = await self._fetch_player_html(client, player_id)
-                    profile_data = parse_player_profile_html(html, None)
+                    profile_data = parse_player_profile_html(
+                        html,
+                        None,
+                        include_summary=include_summary,
+                        include_stats=include_stats,
+                    )
                 else:
                     # Check Player Cache
                     logger.info("Checking Player Cache...")
@@ -68,7 +79,12 @@ class GetPlayerCareerController(BasePlayerController):
                     ):
                         logger.info("Player Cache found and up-to-date, using it")
                         html = player_cache["profile"]  # ty: ignore[invalid-argument-type]
-                        profile_data = parse_player_profile_html(html, player_summary)
+                        profile_data = parse_player_profile_html(
+                            html,
+                            player_summary,
+                            include_summary=include_summary,
+                            include_stats=include_stats,
+                        )
                     else:
                         # Fetch from Blizzard with Blizzard ID
                         logger.info(
@@ -76,7 +92,12 @@ class GetPlayerCareerController(BasePlayerController):
                         )
                         blizzard_id = player_summary["url"]
                         html = await self._fetch_player_html(client, blizzard_id)
-                        profile_data = parse_player_profile_html(html, player_summary)
+                        profile_data = parse_player_profile_html(
+                            html,
+                            player_summary,
+                            include_summary=include_summary,
+                            include_stats=include_stats,
+                        )
 
                         # Update Player Cache
                         self.cache_manager.update_player_cache(
@@ -117,7 +138,7 @@ class GetPlayerCareerController(BasePlayerController):
 
             # Update API Cache
             self.cache_manager.update_api_cache(self.cache_key, data, self.timeout)
-            self.response.headers[settings.cache_ttl_header] = str(self.timeout)
+            self.set_cache_ttl_header()
 
             return data
 
@@ -24,6 +24,8 @@ class GetPlayerCareerStatsController(BasePlayerController):
     statistics of a player without labels, easily explorable
     """
 
+    __slots__ = ()
+
     parser_classes: ClassVar[list] = []
     timeout = settings.career_path_cache_timeout
 
@@ -118,7 +120,7 @@ class GetPlayerCareerStatsController(BasePlayerController):
 
             # Update API Cache
             self.cache_manager.update_api_cache(self.cache_key, data, self.timeout)
-            self.response.headers[settings.cache_ttl_header] = str(self.timeout)
+            self.set_cache_ttl_header()
 
             return data
 
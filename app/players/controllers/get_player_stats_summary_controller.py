@@ -24,6 +24,8 @@ class GetPlayerStatsSummaryController(BasePlayerController):
     stats of a player, often used for tracking progress: winrate, kda, damage, etc.
     """
 
+    __slots__ = ()
+
     parser_classes: ClassVar[list] = []
     timeout = settings.career_path_cache_timeout
 
@@ -114,7 +116,7 @@ class GetPlayerStatsSummaryController(BasePlayerController):
 
             # Update API Cache
             self.cache_manager.update_api_cache(self.cache_key, data, self.timeout)
-            self.response.headers[settings.cache_ttl_header] = str(self.timeout)
+            self.set_cache_ttl_header()
 
             return data
 
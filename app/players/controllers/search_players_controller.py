@@ -13,6 +13,8 @@ from app.helpers import overfast_internal_error
 class SearchPlayersController(AbstractController):
     """Search Players Controller used in order to find an Overwatch player"""
 
+    __slots__ = ()
+
     parser_classes: ClassVar[list] = []
     timeout = settings.search_account_path_cache_timeout
 
@@ -38,6 +40,6 @@ class SearchPlayersController(AbstractController):
 
         # Update API Cache
         self.cache_manager.update_api_cache(self.cache_key, data, self.timeout)
-        self.response.headers[settings.cache_ttl_header] = str(self.timeout)
+        self.set_cache_ttl_header()
 
         return data
@@ -14,17 +14,17 @@ FLOAT_PATTERN = re.compile(r"^-?\d+(,\d+)*\.\d+$")
 
 
 @cache
+def get_heroes_data_by_key() -> dict[str, dict[str, str]]:
+    """Index heroes CSV rows by hero key, built once and shared
+    by the helpers below instead of one CSV scan per hero key
+    """
+    return {hero_data["key"]: hero_data for hero_data in read_csv_data_file("heroes")}
+
+
 def get_hero_name(hero_key: HeroKey) -> str:  # ty: ignore[invalid-type-form]
     """Get a hero name based on the CSV file"""
-    heroes_data = read_csv_data_file("heroes")
-    return next(
-        (
-            hero_data["name"]
-            for hero_data in heroes_data
-            if hero_data["key"] == hero_key
-        ),
-        hero_key,
-    )
+    hero_data = get_heroes_data_by_key().get(hero_key)
+    return hero_data["name"] if hero_data else hero_key
 
 
 @cache
@@ -86,11 +86,18 @@ def get_computed_stat_value(input_str: str) -> str | float | int:
     return 0 if input_str in {"--", "NaN"} else input_str
 
 
+# Competitive division members by value, precomputed to avoid
+# going through Enum call dispatch on every rank conversion
+COMPETITIVE_DIVISIONS = {division.value: division for division in CompetitiveDivision}
+
+
+@cache
 def get_division_from_icon(rank_url: str) -> CompetitiveDivision:
     division_name = rank_url.split("/")[-1].split("-")[0].split("_")[-1]
-    return CompetitiveDivision(division_name[:-4].lower())
+    return COMPETITIVE_DIVISIONS[division_name[:-4].lower()]
 
 
+@cache
 def get_endorsement_value_from_frame(frame_url: str) -> int:
     """Extracts the endorsement level from the frame URL. 0 if not found."""
     try:
@@ -130,6 +137,7 @@ def get_stats_hero_class(hero_class: str | None) -> str:
     return hero_class[start_index:end_index]
 
 
+@cache
 def get_tier_from_icon(tier_url: str | None) -> int:
     """Extracts the rank tier from the rank URL. 0 if not found."""
     if not tier_url:
@@ -160,11 +168,7 @@ def remove_accents(input_str: str) -> str:
 @cache
 def get_hero_role(hero_key: HeroKey) -> Role:  # ty: ignore[invalid-type-form]
     """Get the role of a given hero based on the CSV file"""
-    heroes_data = read_csv_data_file("heroes")
-    role_key = next(
-        hero_data["role"] for hero_data in heroes_data if hero_data["key"] == hero_key
-    )
-    return Role(role_key)
+    return Role(get_heroes_data_by_key()[hero_key]["role"])
 
 
 @cache
@@ -16,6 +16,8 @@ class ListRolesController(AbstractController):
     retrieve a list of available Overwatch roles.
     """
 
+    __slots__ = ()
+
     parser_classes: ClassVar[list[type]] = []
     timeout = settings.heroes_path_cache_timeout
 
@@ -33,6 +35,6 @@ class ListRolesController(AbstractController):
 
         # Update API Cache
         self.cache_manager.update_api_cache(self.cache_key, data, self.timeout)
-        self.response.headers[settings.cache_ttl_header] = str(self.timeout)
+        self.set_cache_ttl_header()
 
         return data
@@ -1,9 +1,14 @@
 import json
+from functools import cache
 from pathlib import Path
 
 from app.config import settings
 
 
+# HTML fixtures (especially player profiles) weigh several megabytes and
+# are read by multiple test modules : cache them for the whole session.
+# JSON fixtures are not cached, as tests may mutate the returned objects
+@cache
 def read_html_file(filepath: str) -> str | None:
     """Helper method for retrieving fixture HTML file data"""
     html_file_object = Path(f"{settings.test_fixtures_root_path}/html/{filepath}")
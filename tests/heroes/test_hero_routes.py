@@ -157,6 +157,38 @@ def test_get_hero_no_hitpoints(
     assert response.json()["hitpoints"] is None
 
 
+@pytest.mark.parametrize(
+    ("hero_name", "hero_html_data"),
+    [(HeroKey.ANA, HeroKey.ANA)],  # ty: ignore[unresolved-attribute]
+    indirect=["hero_html_data"],
+)
+def test_get_hero_from_api_cache(
+    client: TestClient,
+    hero_name: HeroKey,  # ty: ignore[invalid-type-form]
+    hero_html_data: str,
+    heroes_html_data: str,
+):
+    with patch(
+        "httpx.AsyncClient.get",
+        side_effect=[
+            Mock(status_code=status.HTTP_200_OK, text=hero_html_data),
+            Mock(status_code=status.HTTP_200_OK, text=heroes_html_data),
+        ],
+    ) as get_mock:
+        # First request : computed from Blizzard pages, fills the API Cache
+        response1 = client.get(f"/heroes/{hero_name}")
+        # Second identical request : served from the API Cache, without
+        # any further Blizzard call
+        response2 = client.get(f"/heroes/{hero_name}")
+
+    assert get_mock.call_count == 2
+    assert response1.status_code == response2.status_code == status.HTTP_200_OK
+    assert response2.json() == response1.json()
+    assert response2.headers[settings.cache_ttl_header] == str(
+        settings.hero_path_cache_timeout,
+    )
+
+
 def test_get_hero_blizzard_forbidden_error_and_caching(client: TestClient):
     with patch(
         "httpx.AsyncClient.get",
@@ -241,7 +241,7 @@ def test_string_to_snakecase(input_str: str, result: str):
 def test_get_hero_role(hero_key: HeroKey):  # ty: ignore[invalid-type-form]
     try:
         helpers.get_hero_role(hero_key)
-    except StopIteration:
+    except KeyError:
         pytest.fail(f"Missing role for '{hero_key}' hero")
 
 
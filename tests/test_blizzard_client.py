@@ -0,0 +1,87 @@
+import asyncio
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+from fastapi import HTTPException, status
+
+from app.adapters.blizzard import BlizzardClient
+from app.config import settings
+
+blizzard_url = f"{settings.blizzard_host}/en-us{settings.heroes_path}"
+
+
+@pytest.fixture
+def blizzard_client() -> BlizzardClient:
+    return BlizzardClient()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_are_coalesced(
+    blizzard_client: BlizzardClient,
+):
+    response_mock = Mock(status_code=status.HTTP_200_OK, text="OK")
+
+    with patch("httpx.AsyncClient.get", return_value=response_mock) as get_mock:
+        responses = await asyncio.gather(
+            *(blizzard_client.get(blizzard_url) for _ in range(5)),
+        )
+
+    # Only one call to Blizzard was made, and every caller received its result
+    assert get_mock.call_count == 1
+    assert all(response is response_mock for response in responses)
+
+    # The in-flight requests map has been cleaned up
+    await asyncio.sleep(0)
+    assert blizzard_client.inflight_requests == {}
+
+
+@pytest.mark.asyncio
+async def test_coalesced_requests_all_receive_the_error(
+    blizzard_client: BlizzardClient,
+):
+    with patch(
+        "httpx.AsyncClient.get",
+        side_effect=httpx.TimeoutException("Timeout"),
+    ) as get_mock:
+        results = await asyncio.gather(
+            *(blizzard_client.get(blizzard_url) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    # Only one call to Blizzard was made, and every caller received the error
+    assert get_mock.call_count == 1
+    assert all(
+        isinstance(result, HTTPException)
+        and result.status_code == status.HTTP_504_GATEWAY_TIMEOUT
+        for result in results
+    )
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_coalesced_request(
+    blizzard_client: BlizzardClient,
+):
+    response_mock = Mock(status_code=status.HTTP_200_OK, text="OK")
+    blizzard_response_event = asyncio.Event()
+
+    async def blizzard_get(*_args, **_kwargs) -> Mock:
+        await blizzard_response_event.wait()
+        return response_mock
+
+    with patch("httpx.AsyncClient.get", side_effect=blizzard_get) as get_mock:
+        first_caller = asyncio.ensure_future(blizzard_client.get(blizzard_url))
+        second_caller = asyncio.ensure_future(blizzard_client.get(blizzard_url))
+
+        # Let both callers start waiting on the shared request, then
+        # cancel the first one (simulating a client disconnect)
+        await asyncio.sleep(0)
+        first_caller.cancel()
+        blizzard_response_event.set()
+
+        # The shared request must not have been cancelled under the second caller
+        assert await second_caller is response_mock
+
+    assert get_mock.call_count == 1
+    with pytest.raises(asyncio.CancelledError):
+        await first_caller
@@ -90,6 +90,10 @@ def list_routes_to_update(args: argparse.Namespace) -> dict[str, str]:
     return route_file_mapping
 
 
+# Maximum number of concurrent requests while downloading fixtures
+CONCURRENT_REQUESTS = 5
+
+
 def save_fixture_file(filepath: str, content: str):  # pragma: no cover
     """Method used to save the fixture file on the disk"""
     with Path(filepath).open(mode="w", encoding="utf-8") as html_file:
@@ -109,10 +113,12 @@ async def main():
     route_file_mapping = list_routes_to_update(args)
     locale = Locale.ENGLISH_US
 
-    # Do the job
+    # Do the job, limiting the number of concurrent requests to Blizzard
     test_data_path = f"{settings.test_fixtures_root_path}/html"
-    async with httpx.AsyncClient() as client:
-        for route, filepath in route_file_mapping.items():
+    semaphore = asyncio.Semaphore(CONCURRENT_REQUESTS)
+
+    async def update_fixture(client: httpx.AsyncClient, route: str, filepath: str):
+        async with semaphore:
             logger.info("Updating {}{}...", test_data_path, filepath)
             logger.info("GET {}/{}{}...", settings.blizzard_host, locale, route)
             response = await client.get(
@@ -130,6 +136,14 @@ async def main():
             else:
                 logger.error("Error while getting the page : {}", response.text)
 
+    async with httpx.AsyncClient() as client:
+        await asyncio.gather(
+            *[
+                update_fixture(client, route, filepath)
+                for route, filepath in route_file_mapping.items()
+            ],
+        )
+
     logger.info("Fixtures update finished !")
 
 